@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import logging
+
 import scrapy
+from scrapy import signals
 
 from .items import EventItem
 from .tools import convert_list_to_string, fetch_scraped_indexes
@@ -30,6 +33,28 @@ class TemplateSpider(scrapy.Spider):
     """ These two `_css_selector_*` fields are used to locate news list div tag on news list page and
     to locate article div tag on article page. Must contain string."""
 
+    time_budget = None
+    """ Wall-clock seconds the spider may run. When spent, spider is closed by timer, so pipeline
+    still ends storage session. Can be given at start with `-a time_budget=600`.
+    `None` means unlimited."""
+    request_budget = None
+    """ Maximal number of article requests scheduled per run. Can be given at start with
+    `-a request_budget=50`. `None` means unlimited."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_budget = self._parse_budget('time_budget', float)
+        self._request_budget = self._parse_budget('request_budget', int)
+        self._time_budget_task = None
+        self._requests_scheduled = 0
+
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        spider = super().from_crawler(crawler, *args, **kwargs)
+        crawler.signals.connect(spider._start_time_budget, signal=signals.spider_opened)
+        crawler.signals.connect(spider._cancel_time_budget, signal=signals.spider_closed)
+        return spider
+
     ### "parse" methods
     def parse(self, response: scrapy.http.Response):
         self._scraped_indexes = self._scraped_in_past
@@ -62,12 +87,13 @@ class TemplateSpider(scrapy.Spider):
         else:
             raise NotImplementedError('Need to define "{}" field.'.format(field_name))
 
-    @property
-    def _scraped_in_past(self):
-        return fetch_scraped_indexes(self.name)
+    def _convert_index_to_freshness(self, index: str) -> int or None:
+        """ function that returns comparable freshness of article by it's index (bigger is newer).
+        Returns `None` when freshness is unknown, then only position on page is used."""
+        return None
 
-    ### "yield" methods that returns generators
-    def _yield_request(self, path_or_url: str):
+    def _split_path_or_url(self, path_or_url: str) -> tuple:
+        """ Returns `(url, path)` pair for given relative path or absolute url."""
         if '://' in path_or_url:
             url = path_or_url
             # extracting relative path from url
@@ -76,12 +102,87 @@ class TemplateSpider(scrapy.Spider):
         else:
             path = path_or_url
             url = '{protocol}://{host}/{path}'.format(protocol=self._protocol, host=self.allowed_domains[0], path=path)
-        index = self._convert_path_to_index(path)
+        return url, path
+
+    def _rank_paths(self, paths: list, main_paths: list = ()) -> list:
+        """ Returns `(url, index)` pairs ordered by value: `main_paths` first in given order, then `paths`
+        from newest to oldest, ties broken by position on page. Duplicates are dropped."""
+        ranked = []
+        seen_indexes = set()
+        for path_or_url in main_paths:
+            url, path = self._split_path_or_url(path_or_url)
+            index = self._convert_path_to_index(path)
+            if index not in seen_indexes:
+                seen_indexes.add(index)
+                ranked.append((url, index))
+        candidates = []
+        for position, path_or_url in enumerate(paths):
+            url, path = self._split_path_or_url(path_or_url)
+            index = self._convert_path_to_index(path)
+            if index not in seen_indexes:
+                seen_indexes.add(index)
+                freshness = self._convert_index_to_freshness(index)
+                candidates.append((freshness is None, -(freshness or 0), position, url, index))
+        ranked.extend(candidate[-2:] for candidate in sorted(candidates))
+        return ranked
+
+    def _parse_budget(self, field_name: str, converter) -> float or int or None:
+        value = self.__getattribute__(field_name)
+        if value is None or value == '':
+            return None
+        try:
+            budget = converter(value)
+            assert budget > 0
+        except (ValueError, TypeError, AssertionError):
+            raise RuntimeError('Wrong "{}" argument, positive {} expected: {}'.format(
+                field_name, converter.__name__, value))
+        return budget
+
+    def _start_time_budget(self, spider: scrapy.spiders.Spider):
+        if spider is self and self._time_budget is not None:
+            from twisted.internet import reactor
+            self._time_budget_task = reactor.callLater(self._time_budget, self._close_on_time_budget)
+
+    def _cancel_time_budget(self, spider: scrapy.spiders.Spider):
+        if spider is self and self._time_budget_task is not None and self._time_budget_task.active():
+            self._time_budget_task.cancel()
+
+    def _close_on_time_budget(self):
+        logging.info('Time budget of {} seconds is spent, closing "{}" spider.'.format(
+            self._time_budget, self.name))
+        self.crawler.engine.close_spider(self, 'time_budget_exceeded')
+
+    def _request_budget_exceeded(self) -> bool:
+        return self._request_budget is not None and self._requests_scheduled >= self._request_budget
+
+    @property
+    def _scraped_in_past(self):
+        return fetch_scraped_indexes(self.name)
+
+    ### "yield" methods that returns generators
+    def _yield_request(self, path_or_url: str, priority: int = 0):
+        url, path = self._split_path_or_url(path_or_url)
+        yield from self._yield_article_request(url, self._convert_path_to_index(path), priority)
+
+    def _yield_article_request(self, url: str, index: str, priority: int = 0):
         if index not in self._scraped_indexes:
+            self._requests_scheduled += 1
             yield scrapy.http.Request(url=url,
                                       callback=self.parse_article,
+                                      priority=priority,
                                       meta={'index': index})
 
+    def _yield_prioritized_requests(self, paths: list, main_paths: list = ()):
+        """ Yields requests with `parse_article` callback in order of `_rank_paths`,
+        most valuable article with the highest priority, while budget isn't spent."""
+        ranked = self._rank_paths(paths, main_paths)
+        for rank, (url, index) in enumerate(ranked):
+            if self._request_budget_exceeded():
+                logging.info('Request budget of {} is spent, {} articles are not scheduled.'.format(
+                    self._request_budget, len(ranked) - rank))
+                return
+            yield from self._yield_article_request(url, index, priority=len(ranked) - rank)
+
     def _yield_article_item(self, response: scrapy.http.Response, **kwargs):
         yield EventItem(
             url=response.url,
@@ -92,9 +193,14 @@ class TemplateSpider(scrapy.Spider):
     def _yield_requests_from_response(self, response: scrapy.http.Response):
         """ Yields requests with `parse_article` callback.
         Takes response, finds, extracts news list, extracts from every path and generates requests."""
-        for selector in response.css(self._css_selector_news_list):
+        yield from self._yield_prioritized_requests(list(self._extract_paths_from_response(response)))
+
+    def _extract_paths_from_response(self, response: scrapy.http.Response):
+        """ Yields relative paths to articles from news list in order of their position on page."""
+        for selector in self._find_news_list_in_responce(response):
             path = selector.xpath(self._xpath_selector_path).extract_first()
-            yield from self._yield_request(path)
+            if path is not None:
+                yield path
 
     ### "find" methods that returns Selectors
     def _find_by_xpath_list(self, article: scrapy.selector.SelectorList, xpath_string_selectors_list: list or tuple) -> scrapy.selector.SelectorList:
@@ -23,11 +23,14 @@ class GismeteoSpider(TemplateSpider):
     def parse(self, response: scrapy.http.Response):
         self._scraped_indexes = self._scraped_in_past
         # extract url from main article in img
-        spotted_event = response.css('.main-news')[0]
-        path = spotted_event.xpath('div/div/a/@href').extract_first()
-        yield from self._yield_request(path)
-        # extract urls from list
-        yield from self._yield_requests_from_response(response)
+        main_path = response.css('.main-news').xpath('div/div/a/@href').extract_first()
+        # extract urls from list and schedule them after main article
+        yield from self._yield_prioritized_requests(list(self._extract_paths_from_response(response)),
+                                                    main_paths=[main_path] if main_path is not None else [])
 
     def _convert_path_to_index(self, path: str) -> str:
         return path.split('/')[-2].split('-')[0]
+
+    def _convert_index_to_freshness(self, index: str) -> int or None:
+        # article ids on gismeteo are growing with time
+        return int(index) if index.isdigit() else None
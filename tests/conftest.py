@@ -0,0 +1,8 @@
+import sys
+import types
+
+# `scrapy_climate.args` reads deployed `options.json` at import, which isn't in repository,
+# so spiders are imported with stand-in options.
+args = types.ModuleType('scrapy_climate.args')
+args.options = types.SimpleNamespace(project_id='0', api_key='')
+sys.modules.setdefault('scrapy_climate.args', args)
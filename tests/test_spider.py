@@ -0,0 +1,78 @@
+import pytest
+import scrapy
+
+from scrapy_climate.spiders.gismeteo import GismeteoSpider
+
+
+def make_spider(scraped_indexes=(), **kwargs) -> GismeteoSpider:
+    spider = GismeteoSpider(**kwargs)
+    spider._scraped_indexes = list(scraped_indexes)
+    return spider
+
+
+def make_response(main_path: str or None, list_paths: list) -> scrapy.http.HtmlResponse:
+    main_news = '<div class="main-news"><div><div><a href="{}">main</a></div></div></div>'.format(main_path) \
+        if main_path is not None else ''
+    items = ''.join('<div class="item"><div class="item__title"><a href="{}">news</a></div></div>'.format(path)
+                    for path in list_paths)
+    body = '<html><body>{}{}<div class="item"></div></body></html>'.format(main_news, items)
+    return scrapy.http.HtmlResponse(url='https://www.gismeteo.ua/news/', body=body, encoding='utf-8')
+
+
+def test_rank_paths_puts_main_news_first_then_newest():
+    spider = make_spider()
+    ranked = spider._rank_paths(['/news/a/100-old/', '/news/a/300-new/', '/news/a/200-mid/'],
+                                main_paths=['/news/a/50-main/'])
+    assert [index for url, index in ranked] == ['50', '300', '200', '100']
+
+
+def test_rank_paths_drops_duplicates_and_keeps_position_for_unknown_freshness():
+    spider = make_spider()
+    ranked = spider._rank_paths(['/news/a/x-first/', '/news/a/50-main/', '/news/a/y-second/', '/news/a/10-old/'],
+                                main_paths=['/news/a/50-main/'])
+    assert [index for url, index in ranked] == ['50', '10', 'x', 'y']
+
+
+def test_prioritized_requests_without_budget():
+    spider = make_spider(scraped_indexes=['200'])
+    requests = list(spider._yield_prioritized_requests(['/news/a/100-old/', '/news/a/200-mid/'],
+                                                       main_paths=['/news/a/300-main/']))
+    assert [request.meta['index'] for request in requests] == ['300', '100']
+    assert requests[0].priority > requests[1].priority
+
+
+def test_prioritized_requests_stop_on_request_budget():
+    spider = make_spider(request_budget='2')
+    requests = list(spider._yield_prioritized_requests(['/news/a/100-old/', '/news/a/200-mid/', '/news/a/300-new/'],
+                                                       main_paths=['/news/a/50-main/']))
+    assert [request.meta['index'] for request in requests] == ['50', '300']
+    assert list(spider._yield_prioritized_requests(['/news/a/400-newest/'])) == []
+
+
+def test_parse_skips_missing_hrefs(monkeypatch):
+    monkeypatch.setattr(GismeteoSpider, '_scraped_in_past', property(lambda self: []))
+    spider = make_spider()
+    requests = list(spider.parse(make_response(None, ['/news/a/100-old/', '/news/a/200-new/'])))
+    assert [request.meta['index'] for request in requests] == ['200', '100']
+
+
+@pytest.mark.parametrize('argument', ['time_budget', 'request_budget'])
+@pytest.mark.parametrize('value', ['10m', '0', '-5'])
+def test_wrong_budget_argument_is_reported(argument, value):
+    with pytest.raises(RuntimeError, match=argument):
+        GismeteoSpider(**{argument: value})
+
+
+def test_time_budget_timer_is_scheduled_and_cancelled():
+    spider = make_spider(time_budget='600')
+    spider._start_time_budget(spider)
+    task = spider._time_budget_task
+    assert task.active()
+    spider._cancel_time_budget(spider)
+    assert not task.active()
+
+
+def test_no_time_budget_timer_by_default():
+    spider = make_spider()
+    spider._start_time_budget(spider)
+    assert spider._time_budget_task is None